@@ -9,11 +9,10 @@ Expects seL4-platforms/ to be co-located or otherwise in the PYTHONPATH.
 """
 
 from builds import Build, run_build_script, run_builds, load_builds, release_mq_locks, SKIP
-from pprint import pprint
 from typing import List, Union
 
-import json
 import os
+import shlex
 import sys
 
 from platforms import load_yaml, gh_output
@@ -28,10 +27,24 @@ from platforms import load_yaml, gh_output
 class SimBuild():
     """Represents one simulation build + run."""
 
+    __slots__ = ('name', 'match', 'exclude', 'iterator', 'sim_cmd')
+
     def __init__(self, sim: dict):
-        post = "_" + sim['iterator'][:1] if len(sim['iterator']) > 0 else ""
-        self.name = sim['match'] + post
-        self.__dict__.update(**sim)
+        self.match = sim['match']
+        self.exclude = sim['exclude']
+        self.iterator = sim['iterator']
+        post = "_" + self.iterator[:1] if len(self.iterator) > 0 else ""
+        self.name = sys.intern(self.match + post)
+        # assemble the command once; quoting also keeps the shell happy
+        # should match/exclude ever contain special characters
+        self.sim_cmd = \
+            'cd ../projects/camkes/tests && ' \
+            'SEL4_CACHE_DIR=~/.sel4_cache/ ' \
+            f"REGEX={shlex.quote(self.match)} " \
+            f"EXCLUDE_REGEX={shlex.quote(self.exclude)} " \
+            'VERBOSE=-VV ' \
+            f"RANGE={shlex.quote(self.iterator)} " \
+            'make run_tests'
 
     def __repr__(self):
         return f"SimBuild('{self.name}', " '{' \
@@ -40,38 +53,35 @@ class SimBuild():
             f" 'iterator': '{self.iterator}'" \
             ' })'
 
+    def build_script(self) -> list:
+        """Return the script to run this simulation build."""
+        return [['bash', '-c', self.sim_cmd]]
+
+
+def hw_build_script(build: Build) -> list:
+    """Return the script to build one hardware app image."""
+
+    app = apps[build.app]
+    build.files = build.get_platform().image_names(build.get_mode(), "capdl-loader")
+    build.settings['CAMKES_APP'] = build.app
+    del build.settings['BAMBOO']  # not used in this test, avoid warning
+
+    if app.get('has_cakeml'):
+        build.settings['CAKEMLDIR'] = '/cakeml'
+        build.settings['CAKEML_BIN'] = f"/cake-x64-{build.get_mode()}/cake"
+
+    return [
+        ["../init-build.sh"] + build.settings_args(),
+        ["ninja"],
+        # pigz compresses on all cores, plain gzip is single-threaded
+        ["tar", "-I", "pigz", "-cf", f"../{build.name}-images.tar.gz", "images/"],
+    ]
+
 
 def run_build(manifest_dir: str, build: Union[Build, SimBuild]):
     """Run one CAmkES test. Can be either Build or SimBuild."""
 
-    if isinstance(build, Build):
-        app = apps[build.app]
-        build.files = build.get_platform().image_names(build.get_mode(), "capdl-loader")
-        build.settings['CAMKES_APP'] = build.app
-        del build.settings['BAMBOO']  # not used in this test, avoid warning
-
-        if app.get('has_cakeml'):
-            build.settings['CAKEMLDIR'] = '/cakeml'
-            build.settings['CAKEML_BIN'] = f"/cake-x64-{build.get_mode()}/cake"
-
-        script = [
-            ["../init-build.sh"] + build.settings_args(),
-            ["ninja"],
-            ["tar", "czf", f"../{build.name}-images.tar.gz", "images/"],
-        ]
-    elif isinstance(build, SimBuild):
-        script = [
-            ['bash', '-c',
-             'cd ../projects/camkes/tests && '
-             f"SEL4_CACHE_DIR=~/.sel4_cache/ "
-             f"REGEX={build.match} "
-             f"EXCLUDE_REGEX={build.exclude} "
-             f"VERBOSE=-VV "
-             f"RANGE={build.iterator} "
-             'make run_tests'],
-        ]
-    else:
-        print(f"Warning: unknown build type for {build.name}")
+    script = build.build_script() if isinstance(build, SimBuild) else hw_build_script(build)
 
     return run_build_script(manifest_dir, build, script)
 
@@ -96,46 +106,62 @@ def build_filter(build: Build):
     app = apps[build.app]
     plat = build.get_platform()
 
+    # platform check first, it rejects most builds
     if plat.name not in app['platforms']:
         return False
-    if plat.arch == 'arm' and build.get_mode() not in app['arm_modes']:
+
+    mode = build.get_mode()
+    if plat.arch == 'arm' and mode not in app['arm_modes']:
         return False
-    if plat.arch == 'x86' and build.get_mode() not in app['x86_modes']:
+    if plat.arch == 'x86' and mode not in app['x86_modes']:
         return False
 
     return True
 
 
-def sim_build_filter(build: SimBuild):
-    name = os.environ.get('INPUT_NAME')
-    plat = os.environ.get('INPUT_PLATFORM')
-    return (not name or build.name == name) and (not plat or plat == 'sim')
-
-
 def to_json(builds: List[Build]) -> str:
     """Return a GitHub build matrix as GitHub output assignment."""
 
+    import json
+
     matrix = {"include": [{"name": b.name, "platform": b.get_platform().name} for b in builds]}
-    return "matrix=" + json.dumps(matrix)
+    return "matrix=" + json.dumps(matrix, separators=(',', ':'))
 
 
 # If called as main, run all builds from builds.yml
 if __name__ == '__main__':
     yml = load_yaml(os.path.dirname(__file__) + "/builds.yml")
     apps = yml['apps']
+    # the app filter does many membership tests against these
+    for app in apps.values():
+        app['platforms'] = frozenset(sys.intern(p) for p in app['platforms'])
+        app['arm_modes'] = frozenset(app['arm_modes'])
+        app['x86_modes'] = frozenset(app['x86_modes'])
     sim_builds = [SimBuild(s) for s in yml['sim']]
     hw_builds = load_builds(None, build_filter, yml)
-    builds = [b for b in sim_builds if sim_build_filter(b)] + hw_builds
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--dump':
+    # filter sim builds; env lookups hoisted out of the comprehension
+    name = os.environ.get('INPUT_NAME')
+    plat = os.environ.get('INPUT_PLATFORM')
+    if plat and plat != 'sim':
+        sim_builds = []
+    elif name:
+        sim_builds = [b for b in sim_builds if b.name == name]
+
+    builds = sim_builds + hw_builds
+
+    arg = sys.argv[1] if len(sys.argv) > 1 else None
+
+    if arg == '--dump':
+        from pprint import pprint
         pprint(builds)
         sys.exit(0)
-    elif len(sys.argv) > 1 and sys.argv[1] == '--matrix':
+    elif arg == '--matrix':
         gh_output(to_json(builds))
         sys.exit(0)
-    elif len(sys.argv) > 1 and sys.argv[1] == '--hw':
+    elif arg == '--hw':
         sys.exit(run_builds(builds, hw_run))
-    elif len(sys.argv) > 1 and sys.argv[1] == '--post':
+    elif arg == '--post':
         release_mq_locks(builds)
         sys.exit(0)
 
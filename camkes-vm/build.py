@@ -9,7 +9,6 @@ Expects seL4-platforms/ to be co-located or otherwise in the PYTHONPATH.
 """
 
 from builds import Build, run_build_script, run_builds, load_builds, release_mq_locks, SKIP, sim_script
-from pprint import pprint
 
 import os
 import sys
@@ -40,7 +39,8 @@ def run_build(manifest_dir: str, build: Build):
     script = [
         ["../init-build.sh"] + build.settings_args(),
         ["ninja"],
-        ["tar", "czf", f"../{build.name}-images.tar.gz", "images/"],
+        # pigz compresses on all cores, plain gzip is single-threaded
+        ["tar", "-I", "pigz", "-cf", f"../{build.name}-images.tar.gz", "images/"],
     ]
 
     if plat.has_simulation and plat.name != 'PC99':
@@ -68,12 +68,15 @@ def hw_run(manifest_dir: str, build: Build):
 if __name__ == '__main__':
     builds = load_builds(os.path.dirname(__file__) + "/builds.yml")
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--dump':
+    arg = sys.argv[1] if len(sys.argv) > 1 else None
+
+    if arg == '--dump':
+        from pprint import pprint
         pprint(builds)
         sys.exit(0)
-    elif len(sys.argv) > 1 and sys.argv[1] == '--hw':
+    elif arg == '--hw':
         sys.exit(run_builds(builds, hw_run))
-    elif len(sys.argv) > 1 and sys.argv[1] == '--post':
+    elif arg == '--post':
         release_mq_locks(builds)
         sys.exit(0)
 
@@ -9,7 +9,6 @@ Expects seL4-platforms/ to be co-located or otherwise in the PYTHONPATH.
 """
 
 from builds import run_build_script, run_builds, load_builds
-from pprint import pprint
 
 import os
 import sys
@@ -32,7 +31,10 @@ def run_cparser(manifest_dir: str, build):
 if __name__ == '__main__':
     builds = load_builds(os.path.dirname(__file__) + "/builds.yml")
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--dump':
+    arg = sys.argv[1] if len(sys.argv) > 1 else None
+
+    if arg == '--dump':
+        from pprint import pprint
         pprint(builds)
         sys.exit(0)
 
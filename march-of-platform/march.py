@@ -2,14 +2,62 @@
 #
 # SPDX-License-Identifier: BSD-2-Clause
 
-from platforms import platforms, gh_output
+"""Emit the march of a platform as GitHub output.
+
+This script runs once per matrix entry, so resolved values are cached in
+$RUNNER_TEMP; only the first invocation pays for loading the platform
+definitions."""
+
+import json
+import os
 import sys
+import tempfile
+
+
+def gh_output_march(march: str):
+    """Set the march GitHub action output variable.
+
+    Local copy of platforms.gh_output, so that a cache hit does not import
+    (and thereby parse) the platform definitions."""
+    fname = os.environ.get("GITHUB_OUTPUT")
+    if not fname:
+        print("Warning: GITHUB_OUTPUT not set")
+        fname = "github.output"
+    with open(fname, "a") as file:
+        print(f"march={march}", file=file)
+
 
 if __name__ == '__main__':
     if len(sys.argv) == 2:
-        plat = platforms.get(sys.argv[1].upper())
+        name = sys.argv[1].upper()
+
+        cache = os.path.join(os.environ.get("RUNNER_TEMP") or tempfile.gettempdir(),
+                             "march-cache.json")
+        try:
+            with open(cache, 'r') as file:
+                cached = json.load(file)
+        except (IOError, ValueError):
+            cached = {}
+
+        march = cached.get(name)
+        if march:
+            gh_output_march(march)
+            sys.exit(0)
+
+        # cache miss; importing platforms parses platforms.yml
+        from platforms import platforms
+
+        plat = platforms.get(name)
         if plat:
-            gh_output(f"march={plat.march}")
+            cached[name] = plat.march
+            try:
+                tmp = f"{cache}.{os.getpid()}"
+                with open(tmp, 'w') as file:
+                    json.dump(cached, file)
+                os.replace(tmp, cache)
+            except IOError:
+                pass
+            gh_output_march(plat.march)
             sys.exit(0)
         else:
             print(f"Unknown platform {sys.argv[1]}")
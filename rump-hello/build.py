@@ -10,7 +10,6 @@ Expects seL4-platforms/ to be co-located or otherwise in the PYTHONPATH.
 
 from builds import Build, run_build_script, run_builds, load_builds, sim_script
 from builds import release_mq_locks, SKIP
-from pprint import pprint
 
 import os
 import sys
@@ -34,7 +33,8 @@ def run_build(manifest_dir: str, build: Build):
     if build.req == 'sim':
         script.append(sim_script(build.success))
     else:
-        script.append(["tar", "czf", f"../{build.name}-images.tar.gz", "images/"])
+        # pigz compresses on all cores, plain gzip is single-threaded
+        script.append(["tar", "-I", "pigz", "-cf", f"../{build.name}-images.tar.gz", "images/"])
 
     return run_build_script(manifest_dir, build, script)
 
@@ -57,14 +57,17 @@ def hw_run(manifest_dir: str, build: Build):
 if __name__ == '__main__':
     builds = load_builds(os.path.dirname(__file__) + "/builds.yml")
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--dump':
+    arg = sys.argv[1] if len(sys.argv) > 1 else None
+
+    if arg == '--dump':
+        from pprint import pprint
         pprint(builds)
         sys.exit(0)
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--hw':
+    if arg == '--hw':
         sys.exit(run_builds(builds, hw_run))
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--post':
+    if arg == '--post':
         release_mq_locks(builds)
         sys.exit(0)
 
@@ -12,16 +12,17 @@ them, `run_build_script` for a standard test driver frame, and
 `default_junit_results` for a standard place to leave a jUnit summary file.
 """
 
-from junitparser.junitparser import Failure, Error
 from platforms import ValidationException, Platform, platforms, load_yaml, mcs_unsupported
 
 from typing import Optional, List, Tuple, Union
-from junitparser import JUnitXml
+from xml.etree.ElementTree import iterparse
 
-import copy
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import glob
+import itertools
 import time
 import os
-import shutil
 import subprocess
 import sys
 
@@ -43,6 +44,14 @@ ANSI_WHITE = "\033[37m"
 ANSI_BOLD = "\033[1m"
 
 
+def copy_yaml_dict(d: dict) -> dict:
+    """Two-level copy of a yaml-shaped dict.
+
+    Values are scalars, lists, or flat dicts, so this is equivalent to a
+    deepcopy for the build defaults, at a fraction of the cost."""
+    return {k: (v.copy() if isinstance(v, (dict, list)) else v) for k, v in d.items()}
+
+
 class Build:
     """Represents a build definition.
 
@@ -63,17 +72,34 @@ class Build:
         self.timeout = 900
         self.no_hw_test = False
         self.image_base_name = "sel4test-driver"
+        # memoization for get_platform()/get_mode(), which are called many
+        # times per build by the filter and settings machinery
+        self._platform = None
+        self._mode = None
+        # merged settings cache for settings_args(); the set_* methods and
+        # update_settings() invalidate it
+        self._merged = None
         [self.name] = entries.keys()
-        attribs = copy.deepcopy(default)
+        attribs = copy_yaml_dict(default)
         # this potentially overwrites the default settings dict, we restore it later
         attribs.update(entries[self.name])
         self.__dict__.update(**attribs)
 
+        # the same app names repeat across the matrix and are looked up in
+        # the per-action app/disable tables
+        if self.app:
+            self.app = sys.intern(self.app)
+
         if 'settings' in default:
             for k, v in default['settings'].items():
                 if k not in self.settings:
                     self.settings[k] = v
 
+        # the same few keys and values repeat across every build of a matrix;
+        # interning dedups the strings and makes dict lookups pointer checks
+        self.settings = {sys.intern(k): sys.intern(v) if isinstance(v, str) else v
+                         for k, v in self.settings.items()}
+
         if self.get_mode():
             self.update_settings()
 
@@ -86,28 +112,45 @@ class Build:
         # somewhat misnamed now; sets test output to parsable xml:
         self.settings["BAMBOO"] = "TRUE"
         self.files = p.image_names(m, self.image_base_name)
+        self._apply_req()
+        self._merged = None
+
+    def _apply_req(self):
+        """The subset of update_settings that depends on req."""
         if self.req == 'sim':
             self.settings["SIMULATION"] = "TRUE"
+            self._merged = None
 
     def get_platform(self) -> Platform:
         """Return the Platform object for this build definition."""
-        return platforms[self.platform]
+        if self._platform is None:
+            self._platform = platforms[self.platform]
+        return self._platform
 
     def get_mode(self) -> Optional[int]:
         """Return the mode (32/64) for this build; taken from platform if not defined"""
-        if not self.mode and self.get_platform().get_mode():
-            return self.get_platform().get_mode()
-        else:
-            return self.mode
+        if self._mode is None:
+            if not self.mode and self.get_platform().get_mode():
+                self._mode = self.get_platform().get_mode()
+            else:
+                self._mode = self.mode
+        return self._mode
 
     def settings_args(self):
-        """Return the build settings as an argument list [-Dkey=val]"""
-        all_settings = {**self.settings, **self.get_platform().settings}
+        """Return the build settings as an argument list [-Dkey=val]
+
+        The merged settings dict is cached; mutate settings via the set_*
+        methods or update_settings() to keep the cache fresh."""
+        all_settings = self._merged
+        if all_settings is None:
+            all_settings = {**self.settings, **self.get_platform().settings}
+            self._merged = all_settings
         return [f"-D{key}={val}" for (key, val) in all_settings.items()]
 
     def set_verification(self):
         """Make this a verification build"""
         self.settings["VERIFICATION"] = "TRUE"
+        self._merged = None
 
     def is_verification(self) -> bool:
         return self.settings.get("VERIFICATION") is not None
@@ -120,6 +163,7 @@ class Build:
         if not self.can_release():
             raise ValidationException("not Build.can_release()")
         self.settings["RELEASE"] = "TRUE"
+        self._merged = None
 
     def is_release(self) -> bool:
         return self.settings.get("RELEASE") is not None
@@ -144,6 +188,7 @@ class Build:
         else:
             # should be unreachable because of self.can_hyp():
             raise ValidationException
+        self._merged = None
 
     def is_hyp(self) -> bool:
         return self.settings.get("ARM_HYP") is not None or \
@@ -151,6 +196,7 @@ class Build:
 
     def set_clang(self):
         self.settings["TRIPLE"] = self.get_platform().get_triple(self.get_mode())
+        self._merged = None
 
     def is_clang(self) -> bool:
         return self.settings.get("TRIPLE") is not None
@@ -165,6 +211,7 @@ class Build:
         if not self.can_mcs():
             raise ValidationException("not Build.can_mcs()")
         self.settings['MCS'] = "TRUE"
+        self._merged = None
 
     def is_mcs(self) -> bool:
         return self.settings.get('MCS') is not None
@@ -176,6 +223,7 @@ class Build:
         if not self.can_smp():
             raise ValidationException("not Build.can_smp()")
         self.settings['SMP'] = "TRUE"
+        self._merged = None
 
     def is_smp(self) -> bool:
         return self.settings.get('SMP') is not None
@@ -187,6 +235,7 @@ class Build:
         if not self.can_domains():
             raise ValidationException("not Build.can_domains()")
         self.settings['DOMAINS'] = "TRUE"
+        self._merged = None
 
     def is_domains(self) -> bool:
         return self.settings.get('DOMAINS') is not None
@@ -241,6 +290,9 @@ class Run:
     Build class. So far we only vary machine requirements (req) and name in a Run.
     """
 
+    # fixed attribute set, no per-instance dict needed
+    __slots__ = ('build', 'name', 'req')
+
     def __init__(self, build: Build, suffix: Optional[str] = None,
                  req: Optional[str] = None):
         self.build = build
@@ -351,9 +403,15 @@ def repeat_on_boot_failure(log: Optional[List[str]]) -> int:
     """Try to repeat the test run if the board failed to boot."""
 
     if log:
+        n = len(log)
         for pat in boot_fail_patterns:
-            for i in range(len(log)+1-len(pat)):
-                if all(p in log[i+j] for j, p in enumerate(pat)):
+            # anchor the scan on the first pattern line; it is non-empty and
+            # distinctive for all patterns, so the full window check below
+            # runs for almost no positions
+            first, rest = pat[0], pat[1:]
+            for i in range(n + 1 - len(pat)):
+                if first in log[i] and \
+                   all(p in log[i+1+j] for j, p in enumerate(rest)):
                     printc(ANSI_RED, "Boot failure detected.")
                     time.sleep(10)
                     return REPEAT, None
@@ -395,21 +453,32 @@ def release_mq_locks(runs: List[Union[Run, Build]]):
             run(mq_print_lock(machine))
 
 
+# lazy caches for job_key()/get_machine(); the environment does not change
+# during a job, so compute these once on first use
+_job_key = None
+_job_index = None
+
+
 def get_machine(req):
+    global _job_index
     if req == []:
         return None
     else:
         # assume jobs for the same platform are consecutive-ish in the build matrix
-        job_index = int(os.environ.get('INPUT_INDEX', '$0')[1:])
-        return req[job_index % len(req)]
+        if _job_index is None:
+            _job_index = int(os.environ.get('INPUT_INDEX', '$0')[1:])
+        return req[_job_index % len(req)]
 
 
 def job_key():
-    return os.environ.get('GITHUB_REPOSITORY') + "-" + \
-        os.environ.get('GITHUB_WORKFLOW') + "-" + \
-        os.environ.get('GITHUB_RUN_ID') + "-" + \
-        os.environ.get('GITHUB_JOB') + "-" + \
-        os.environ.get('INPUT_INDEX', '$0')[1:]
+    global _job_key
+    if _job_key is None:
+        _job_key = os.environ.get('GITHUB_REPOSITORY') + "-" + \
+            os.environ.get('GITHUB_WORKFLOW') + "-" + \
+            os.environ.get('GITHUB_RUN_ID') + "-" + \
+            os.environ.get('GITHUB_JOB') + "-" + \
+            os.environ.get('INPUT_INDEX', '$0')[1:]
+    return _job_key
 
 
 def mq_run(success_str: str,
@@ -495,15 +564,38 @@ def run_cmd(cmd, run: Union[Run, Build], prev_output: Optional[str] = None) -> i
         sys.stdout.flush()
         # Print output as it arrives. Some of the build commands take too long to
         # wait until all output is there. Keep stderr separate, but flush it.
-        process = subprocess.Popen(cmd, text=True, stdout=subprocess.PIPE,
-                                   stderr=sys.stderr, bufsize=1)
+        # Read in large binary chunks rather than text-mode line iteration;
+        # verbose builds produce megabytes of log and per-line decoding in the
+        # TextIOWrapper adds up.
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                   stderr=sys.stderr, bufsize=0)
+        fd = process.stdout.fileno()
         lines = []
-        for line in process.stdout:
-            line = line.rstrip()
+        buf = b''
+        # hoisted bound methods; this loop sees every log line of a build
+        read = os.read
+        append = lines.append
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        while True:
+            chunk = read(fd, 65536)
+            if not chunk:
+                break
+            buf += chunk
+            *full, buf = buf.split(b'\n')
+            for raw in full:
+                line = raw.decode('utf-8', errors='replace').rstrip()
+                append(line)
+                write(line + '\n')
+            # one flush per chunk is enough for live output, flushing per
+            # line is one syscall per log line
+            flush()
+            sys.stderr.flush()
+        if buf:
+            line = buf.decode('utf-8', errors='replace').rstrip()
             lines.append(line)
             print(line)
             sys.stdout.flush()
-            sys.stderr.flush()
         ret = process.wait()
 
         return success_from_bool(ret == 0), lines
@@ -512,36 +604,62 @@ def run_cmd(cmd, run: Union[Run, Build], prev_output: Optional[str] = None) -> i
 
 
 def printc(color: str, content: str):
-    print(color + content + ANSI_RESET)
-
-
-def summarise_junit(file_path: str) -> Tuple[int, List[str]]:
+    # one write call; print() would emit text and newline separately
+    sys.stdout.write(f"{color}{content}{ANSI_RESET}\n")
+
+
+def parse_junit(file_path: str) -> Tuple[int, int, int, int, List[str]]:
+    """Parse jUnit output; return counts and the names of failed cases.
+
+    Raises exception on IOError or XML parse errors. Does not print, so it
+    can run in a background thread."""
+
+    tests = fails = errors = skipped = 0
+    failures = []
+    # stream the file instead of building a tree of per-case objects;
+    # sel4test results can contain thousands of cases
+    for _, elem in iterparse(file_path):
+        if elem.tag != 'testcase':
+            continue
+        tests += 1
+        if elem.find('failure') is not None:
+            fails += 1
+            failures.append(elem.get('name'))
+        elif elem.find('error') is not None:
+            errors += 1
+            failures.append(elem.get('name'))
+        elif elem.find('skipped') is not None:
+            skipped += 1
+        elem.clear()
+
+    return tests, fails, errors, skipped, failures
+
+
+def summarise_junit(file_path: str, parsed=None) -> Tuple[int, List[str]]:
     """Parse jUnit output and show a summary.
 
-    Returns True if there were no failures or errors, raises exception
-    on IOError or XML parse errors."""
+    Takes an optional pre-parsed result from parse_junit. Returns True if
+    there were no failures or errors, raises exception on IOError or XML
+    parse errors."""
 
-    xml = JUnitXml.fromfile(file_path)
-    succeeded = xml.tests - (xml.failures + xml.errors + xml.skipped)
-    success = xml.failures == 0 and xml.errors == 0
+    tests, fails, errors, skipped, failures = parsed or parse_junit(file_path)
+    succeeded = tests - (fails + errors + skipped)
+    success = fails == 0 and errors == 0
 
     col = ANSI_GREEN if success else ANSI_RED
 
     printc(col, "Test summary")
     printc(col, "------------")
-    printc(ANSI_GREEN if success else "", f"succeeded: {succeeded}/{xml.tests}")
-    if xml.skipped > 0:
-        printc(ANSI_YELLOW, f"skipped:   {xml.skipped}")
-    if xml.failures > 0:
-        printc(ANSI_RED, f"failures:  {xml.failures}")
-    if xml.errors > 0:
-        printc(ANSI_RED, f"errors:    {xml.errors}")
+    printc(ANSI_GREEN if success else "", f"succeeded: {succeeded}/{tests}")
+    if skipped > 0:
+        printc(ANSI_YELLOW, f"skipped:   {skipped}")
+    if fails > 0:
+        printc(ANSI_RED, f"failures:  {fails}")
+    if errors > 0:
+        printc(ANSI_RED, f"errors:    {errors}")
     print()
 
-    failures = {str(case.name) for case in xml
-                if any([isinstance(r, Failure) or isinstance(r, Error) for r in case.result])}
-
-    return success_from_bool(success), list(failures)
+    return success_from_bool(success), failures
 
 
 # where junit results are left after sanitising:
@@ -594,11 +712,20 @@ def run_build_script(manifest_dir: str,
 
         os.chdir(manifest_dir)
 
-        build_dir = 'build'
+        # parallel builds need separate build dirs; keep plain `build` for
+        # serial runs, where scripts and docs expect it
+        build_dir = f"build-{run.name}" if _parallel_builds else 'build'
         try:
-            shutil.rmtree(build_dir)
-        except IOError:
+            # constant-time rename instead of walking the old tree; a build
+            # dir has tens of thousands of object files and a synchronous
+            # rmtree would delay the restart noticeably
+            os.rename(build_dir, f"{build_dir}.old-{time.time_ns()}")
+        except FileNotFoundError:
             pass
+        old_dirs = glob.glob(f"{build_dir}.old-*")
+        if old_dirs:
+            # clean up in the background while the new build runs
+            subprocess.Popen(['rm', '-rf', '--'] + old_dirs)
 
         os.mkdir(build_dir)
         os.chdir(build_dir)
@@ -618,6 +745,15 @@ def run_build_script(manifest_dir: str,
         elif result == SKIP:
             printc(ANSI_YELLOW, ">>> skipping this test.")
 
+        # the junit parse only needs the results file written by `script`, so
+        # it can overlap with the final script steps (lock release etc.); the
+        # summary is printed after the final script, as before
+        junit_future = None
+        if result == SUCCESS and junit:
+            pool = ThreadPoolExecutor(max_workers=1)
+            junit_future = pool.submit(parse_junit, junit_file)
+            pool.shutdown(wait=False)
+
         # run final script tasks even in case of failure, but not for SKIP
         if result != SKIP:
             for line in final_script:
@@ -635,9 +771,9 @@ def run_build_script(manifest_dir: str,
                 # for SKIP and SUCCESS in final script do not change overall result
 
         failures = []
-        if result == SUCCESS and junit:
+        if junit_future and result == SUCCESS:
             try:
-                result, failures = summarise_junit(junit_file)
+                result, failures = summarise_junit(junit_file, junit_future.result())
             except IOError:
                 printc(ANSI_RED, f"Error reading {junit_file}")
                 result = FAILURE
@@ -675,19 +811,6 @@ def run_build_script(manifest_dir: str,
     return result
 
 
-def list_mult(xs: list, ys: list) -> list:
-    """Cross product of two lists. The first list is expected to be a list of lists.
-    Returns a list of lists.
-
-    `list_mult([[a],[b]], [c,d]) == [[a,c], [a,d], [b,c], [b,d]]`
-    """
-    combinations = []
-    for x in xs:
-        for y in ys:
-            combinations.append(x + [y])
-    return combinations
-
-
 def variants(var_dict: dict) -> list:
     """Generate the matrix (=list of lists) of all variants in a variant dict."""
 
@@ -695,11 +818,7 @@ def variants(var_dict: dict) -> list:
     if keys == []:
         return []
 
-    all = [[(keys[0], v)] for v in var_dict[keys[0]]]
-    for k in keys[1:]:
-        all = list_mult(all, [(k, v) for v in var_dict[k]])
-
-    return all
+    return [list(zip(keys, combo)) for combo in itertools.product(*var_dict.values())]
 
 
 def variant_name(variant):
@@ -710,7 +829,7 @@ def variant_name(variant):
 def build_for_platform(platform, default={}):
     """Return a standard build for a given platform, apply optional defaults."""
 
-    the_build = copy.deepcopy(default)
+    the_build = copy_yaml_dict(default)
     the_build["platform"] = platform
 
     return Build({platform: the_build})
@@ -727,12 +846,17 @@ def build_for_variant(base_build: Build, variant, filter_fun=lambda x: True) ->
 
     var_dict = dict(variant)
 
-    build = copy.deepcopy(base_build)
+    # shallow clone; only `settings` is mutated by the feature setters below,
+    # the other attributes are rebound, never modified in place
+    build = Build.__new__(Build)
+    build.__dict__.update(base_build.__dict__)
+    build.settings = base_build.settings.copy()
     build.name = build.name + "_" + variant_name(variant)
 
     mode = var_dict.get("mode") or build.get_mode()
     if mode in build.get_platform().modes:
         build.mode = mode
+        build._mode = None  # invalidate memoized mode of the base build
     else:
         return None
 
@@ -762,8 +886,9 @@ def build_for_variant(base_build: Build, variant, filter_fun=lambda x: True) ->
                 build.app = val
             elif feature == 'req':
                 build.req = val
-                # might change simulation or other settings
-                build.update_settings()
+                # might change the simulation setting; mode and platform are
+                # unchanged here, so skip the full update_settings
+                build._apply_req()
             else:
                 pass
         build.validate()
@@ -790,60 +915,69 @@ def get_env_filters() -> list:
     return [filter]
 
 
-def filtered(build: Build, build_filters: dict) -> Optional[Build]:
-    """Return build if build matches filter criteria, otherwise None."""
-
-    def match_dict(build: Build, f):
-        """Return true if all criteria in the filter are true for this build."""
-        for k, v in f.items():
-            if k == 'arch':
-                if build.get_platform().arch not in v:
-                    return False
-            elif k == 'march':
-                if build.get_platform().march not in v:
-                    return False
-            elif k == 'platform':
-                if build.get_platform().name not in [x.upper() for x in v]:
-                    return False
-            elif k == 'debug':
-                if build.is_debug() and 'debug' not in v:
-                    return False
-                if build.is_release() and 'release' not in v:
+# most selective filter keys first, so a mismatch rejects a build before the
+# broader criteria are even evaluated
+_filter_key_priority = {'name': 0, 'platform': 1, 'app': 2, 'march': 3, 'arch': 4}
+
+
+def compile_filter(f: dict) -> list:
+    """Compile a filter dict into a list of predicates over a Build.
+
+    Filters are matched against every build of the expanded matrix; compiling
+    them once moves the key dispatch and set construction out of that loop.
+    The predicates are free of side effects, so they are ordered by
+    selectivity rather than dict order."""
+
+    preds = []
+    for k, v in sorted(f.items(), key=lambda kv: _filter_key_priority.get(kv[0], 9)):
+        if k == 'arch':
+            s = frozenset(v)
+            preds.append(lambda b, s=s: b.get_platform().arch in s)
+        elif k == 'march':
+            s = frozenset(v)
+            preds.append(lambda b, s=s: b.get_platform().march in s)
+        elif k == 'platform':
+            s = frozenset(x.upper() for x in v)
+            preds.append(lambda b, s=s: b.get_platform().name in s)
+        elif k == 'debug':
+            def match_debug(b, v=v):
+                if b.is_debug() and 'debug' not in v:
                     return False
-                if build.is_verification() and 'verification' not in v:
+                if b.is_release() and 'release' not in v:
                     return False
-            elif k == 'compiler':
-                if build.is_clang():
-                    if 'clang' not in v:
-                        return False
-                else:
-                    if 'gcc' not in v:
-                        return False
-            elif k == 'mode':
-                if build.get_mode() not in v:
+                if b.is_verification() and 'verification' not in v:
                     return False
-            elif k == 'mcs':
-                if (v == '') == build.is_mcs():
-                    return False
-            elif k == 'smp':
-                if (v == '') == build.is_smp():
-                    return False
-            elif k == 'hyp':
-                if (v == '') == build.is_hyp():
-                    return False
-            elif k == 'domains':
-                if (v == '') == build.is_domains():
-                    return False
-            elif k == 'req':
-                for req in v:
-                    if req not in build.get_req():
-                        return False
-            elif k in ['name', 'app']:
-                if vars(build).get(k) not in v:
-                    return False
-            elif not vars(build.get_platform()).get(k):
-                return False
-        return True
+                return True
+            preds.append(match_debug)
+        elif k == 'compiler':
+            preds.append(lambda b, v=v: ('clang' if b.is_clang() else 'gcc') in v)
+        elif k == 'mode':
+            s = frozenset(v)
+            preds.append(lambda b, s=s: b.get_mode() in s)
+        elif k == 'mcs':
+            preds.append(lambda b, v=v: (v == '') != b.is_mcs())
+        elif k == 'smp':
+            preds.append(lambda b, v=v: (v == '') != b.is_smp())
+        elif k == 'hyp':
+            preds.append(lambda b, v=v: (v == '') != b.is_hyp())
+        elif k == 'domains':
+            preds.append(lambda b, v=v: (v == '') != b.is_domains())
+        elif k == 'req':
+            preds.append(lambda b, v=v: all(req in b.get_req() for req in v))
+        elif k in ['name', 'app']:
+            preds.append(lambda b, k=k, v=v: vars(b).get(k) in v)
+        else:
+            preds.append(lambda b, k=k: bool(vars(b.get_platform()).get(k)))
+    return preds
+
+
+# compiled filters, keyed by filter dict identity; the entry keeps a strong
+# reference to the dict so its id cannot be reused while cached
+_compiled_filters = {}
+
+
+def filtered(build: Build, build_filters: dict) -> Optional[Build]:
+    """Return build if build matches filter criteria, otherwise None."""
 
     if not build:
         return None
@@ -852,7 +986,11 @@ def filtered(build: Build, build_filters: dict) -> Optional[Build]:
         return build
 
     for f in build_filters:
-        if match_dict(build, f):
+        cached = _compiled_filters.get(id(f))
+        if cached is None or cached[0] is not f:
+            cached = (f, compile_filter(f))
+            _compiled_filters[id(f)] = cached
+        if all(p(build) for p in cached[1]):
             return build
 
     return None
@@ -876,28 +1014,45 @@ def load_builds(file_name: Optional[str], filter_fun=lambda x: True,
     all_variants = variants(yml.get("variants", {}))
     yml_builds = yml.get("builds", [])
 
+    # generators; both consumers below iterate exactly once, so there is no
+    # need to materialize the intermediate base build list
     if yml_builds == []:
-        base_builds = [build_for_platform(p, default_build) for p in platforms.keys()]
+        base_builds = (build_for_platform(p, default_build) for p in platforms.keys())
     else:
-        base_builds = [Build(b, default_build) for b in yml_builds]
+        base_builds = (Build(b, default_build) for b in yml_builds)
 
     if all_variants == []:
+        # env filters first; they usually select a single platform and are
+        # the more selective of the two passes
         builds = [b for b in base_builds
-                  if b and filtered(b, build_filters) and filtered(b, env_filters)]
+                  if b and filtered(b, env_filters) and filtered(b, build_filters)]
     else:
+        # platform, arch, and march are fixed per base build, so a base build
+        # the env filters reject on those keys alone can skip variant
+        # expansion entirely; other keys (name, mode, features) depend on the
+        # variant and are checked per expanded build as before
+        plat_env_filters = [{k: v for k, v in f.items() if k in ('platform', 'arch', 'march')}
+                            for f in env_filters]
         builds = []
         for b in base_builds:
+            if not filtered(b, plat_env_filters):
+                continue
             for v in all_variants:
                 build = build_for_variant(b, v, filter_fun)
-                build = filtered(build, build_filters)
                 build = filtered(build, env_filters)
+                build = filtered(build, build_filters)
                 if build:
                     builds.append(build)
 
     return builds
 
 
-def run_builds(builds: list, run_fun) -> int:
+# set by run_builds before dispatching to a worker pool; inherited by the
+# forked worker processes
+_parallel_builds = False
+
+
+def run_builds(builds: list, run_fun, jobs: Optional[int] = None) -> int:
     """Run a list of build or run definitions, given a test driver function.
 
     Expects the current directory to be a manifest directory, in which
@@ -905,6 +1060,11 @@ def run_builds(builds: list, run_fun) -> int:
 
     The driver function `run_fun` should take a directory (manifest dir)
     and a Build (or Run), and run this build, returning true iff it was successful.
+
+    Builds are independent of each other, so they can run concurrently on a
+    multi-core runner when `jobs` (or, if not given, BUILD_PARALLELISM) is
+    more than 1. This is opt-in: output of concurrent builds interleaves, and
+    hardware runs contend for machine locks, so the default stays serial.
     """
 
     print()
@@ -912,17 +1072,28 @@ def run_builds(builds: list, run_fun) -> int:
 
     manifest_dir = os.getcwd()
 
+    if jobs is None:
+        jobs = int(os.environ.get('BUILD_PARALLELISM', '1') or '1')
+
     results = {SUCCESS: [], FAILURE: [], SKIP: []}
-    for build in builds:
-        results[run_fun(manifest_dir, build)].append(build.name)
+    if jobs > 1 and len(builds) > 1:
+        global _parallel_builds
+        _parallel_builds = True
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            codes = list(pool.map(run_fun, itertools.repeat(manifest_dir), builds))
+        for build, code in zip(builds, codes):
+            results[code].append(build.name)
+    else:
+        for build in builds:
+            results[run_fun(manifest_dir, build)].append(build.name)
 
     no_failures = results[FAILURE] == []
-    printc(ANSI_GREEN if no_failures else "", "Successful tests: " + ", ".join(results[SUCCESS]))
+    printc(ANSI_GREEN if no_failures else "", f"Successful tests: {', '.join(results[SUCCESS])}")
     if results[SKIP] != []:
         print()
-        printc(ANSI_YELLOW, "SKIPPED tests: " + ", ".join(results[SKIP]))
+        printc(ANSI_YELLOW, f"SKIPPED tests: {', '.join(results[SKIP])}")
     if results[FAILURE] != []:
         print()
-        printc(ANSI_RED, "FAILED tests: " + ", ".join(results[FAILURE]))
+        printc(ANSI_RED, f"FAILED tests: {', '.join(results[FAILURE])}")
 
     return 0 if no_failures else 1
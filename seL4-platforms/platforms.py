@@ -14,12 +14,24 @@ The module loads platforms.yml on init, which includes available architectures,
 modes, platforms, a list of unsupported platforms, and a list of named machines.
 """
 
+from functools import lru_cache
 from io import StringIO
 from typing import Optional
 from pprint import pprint
+import copy
+import hashlib
+import pickle
+import sys
+import tempfile
 import yaml
 import os
 
+try:
+    # libyaml-backed C parser, significantly faster than the pure-Python one
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # exported names:
 __all__ = [
     "Platform", "ValidationException", "load_yaml", "gh_output",
@@ -61,6 +73,17 @@ class Platform:
         self.__dict__.update(**entries)
         if not self.validate():
             raise ValidationException(f"Platform {name} validation")
+        # name/arch/march are compared all over the build filters; interning
+        # makes those comparisons pointer checks
+        self.name = sys.intern(self.name)
+        self.arch = sys.intern(self.arch)
+        if self.march:
+            self.march = sys.intern(self.march)
+
+    def __deepcopy__(self, memo):
+        # Platform objects are singletons created at module init; builds only
+        # ever reference them, so copying a build must not duplicate them.
+        return self
 
     def validate(self) -> bool:
         """Validate the fields of this object for type and invariants"""
@@ -172,8 +195,9 @@ class Platform:
                 "riscv": {32: "riscv64-unknown-elf",
                           64: "riscv64-unknown-elf"}}[self.arch][mode]
 
+    @lru_cache(maxsize=None)
     def image_names(self, mode: int, root_task: str) -> list:
-        """Return generated image name"""
+        """Return generated image name; memoized, callers share the result"""
         im_plat = self.get_image_platform(mode)
         return {
             'arm':   [f"images/{root_task}-image-arm-{im_plat}"],
@@ -194,20 +218,59 @@ class Platform:
         return self.march.capitalize()
 
 
-def load_yaml(file_name):
-    """Load a yaml file"""
+@lru_cache(maxsize=None)
+def _load_yaml_cached(file_name):
+    """Load a yaml file, caching the parsed result on disk.
+
+    CI workflows invoke the build scripts several times per job (--dump,
+    --matrix, --build, --post), each re-parsing the same yaml files. Cache
+    the parsed result in a pickle keyed by file path, mtime, and size, so
+    only the first invocation pays for the parse. The cache lives in
+    $RUNNER_TEMP (or the system temp dir), which GitHub cleans up per job.
+    """
+    st = os.stat(file_name)
+    tag = f"{os.path.abspath(file_name)}-{st.st_mtime_ns}-{st.st_size}"
+    key = hashlib.sha1(tag.encode()).hexdigest()
+    cache_dir = os.environ.get("RUNNER_TEMP") or tempfile.gettempdir()
+    cache_file = os.path.join(cache_dir, f"yaml-cache-{key}.pkl")
+
+    try:
+        with open(cache_file, 'rb') as file:
+            return pickle.load(file)
+    except (IOError, pickle.PickleError):
+        pass
+
     with open(file_name, 'r') as file:
-        return yaml.safe_load(file)
+        data = yaml.load(file, Loader=YamlLoader)
+
+    # atomic write so concurrent invocations see either no cache or a full one
+    try:
+        tmp_file = f"{cache_file}.{os.getpid()}"
+        with open(tmp_file, 'wb') as file:
+            pickle.dump(data, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except IOError:
+        pass
+
+    return data
+
+
+def load_yaml(file_name):
+    """Load a yaml file, memoized per process and cached on disk.
+
+    Returns a fresh copy, since callers mutate nested dicts (e.g. build
+    settings) of the parsed result."""
+    return copy.deepcopy(_load_yaml_cached(os.path.realpath(file_name)))
 
 
-def gh_output(assgn: str):
-    """Set a GitHub action output variable"""
+def gh_output(*assgns: str):
+    """Set GitHub action output variables; batched into a single write"""
     fname = os.environ.get("GITHUB_OUTPUT")
     if not fname:
         print("Warning: GITHUB_OUTPUT not set")
         fname = "github.output"
     with open(fname, "a") as file:
-        print(assgn, file=file)
+        file.write("\n".join(assgns) + "\n")
 
 
 # module init:
@@ -220,8 +283,9 @@ platforms = {name: Platform(name, plat)
              for (name, plat) in _yaml_platforms["platforms"].items()}
 
 mcs_unsupported = _yaml_platforms["mcs_unsupported_platforms"]
-# If there are no unsupported MCS platforms, this will be None
-mcs_unsupported = mcs_unsupported if mcs_unsupported is not None else []
+# If there are no unsupported MCS platforms, this will be None. A frozenset,
+# because Build.can_mcs() does a membership test per build.
+mcs_unsupported = frozenset(mcs_unsupported if mcs_unsupported is not None else [])
 
 for p in mcs_unsupported:
     if not platforms.get(p):
@@ -25,8 +25,7 @@ import time
 
 
 def adjust_build_settings(build: Build):
-    if 'BAMBOO' in build.settings:
-        del build.settings['BAMBOO']  # not used in this build, avoid warning
+    build.settings.pop('BAMBOO', None)  # not used in this build, avoid warning
 
     # see discussion on https://github.com/seL4/sel4bench/pull/20 for hifive exclusion
     if build.is_smp() or build.get_platform().name == 'HIFIVE':
@@ -42,7 +41,8 @@ def hw_build(manifest_dir: str, build: Build):
     script = [
         ["../init-build.sh"] + build.settings_args(),
         ["ninja"],
-        ["tar", "czf", f"../{build.name}-images.tar.gz", "images/"]
+        # pigz compresses on all cores, plain gzip is single-threaded
+        ["tar", "-I", "pigz", "-cf", f"../{build.name}-images.tar.gz", "images/"]
     ]
 
     return run_build_script(manifest_dir, build, script)
@@ -367,18 +367,20 @@ if __name__ == '__main__':
     more_builds = [Build(b, default_build) for b in yml.get("more_builds", [])]
     builds.extend([b for b in more_builds if b and filtered(b, env_filters)])
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--dump':
+    arg = sys.argv[1] if len(sys.argv) > 1 else None
+
+    if arg == '--dump':
         pprint(builds)
         sys.exit(0)
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--hw':
+    if arg == '--hw':
         sys.exit(run_builds(make_runs(builds), hw_run))
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--post':
+    if arg == '--post':
         release_mq_locks(builds)
         sys.exit(0)
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--web':
+    if arg == '--web':
         gen_web(make_runs(builds), yml, "index.html")
         sys.exit(0)
 
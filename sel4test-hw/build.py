@@ -31,7 +31,8 @@ def hw_build(manifest_dir: str, build: Build):
     script = [
         ["../init-build.sh"] + build.settings_args(),
         ["ninja"],
-        ["tar", "czf", f"../{build.name}-images.tar.gz", "images/"],
+        # pigz compresses on all cores, plain gzip is single-threaded
+        ["tar", "-I", "pigz", "-cf", f"../{build.name}-images.tar.gz", "images/"],
         ["cp", "kernel/kernel.elf", f"../{build.name}-kernel.elf"]
     ]
 
@@ -50,54 +51,59 @@ def hw_run(manifest_dir: str, build: Build):
     return run_build_script(manifest_dir, build, script, final_script=final, junit=True)
 
 
+def _sched_context_fail(b: Build) -> bool:
+    # SCHED_CONTEXT_0014 fails on TX1, TX2 and ODROID_C4: https://github.com/seL4/seL4/issues/928
+    return b.is_mcs() and b.is_smp() and b.is_hyp() and b.is_clang()
+
+
+# Per-platform exclusion predicates; a build is rejected when any predicate
+# for its platform fires. Platform names are arch-specific, so the table
+# replaces the per-arch if/elif chains that build_filter used to re-evaluate
+# for every build.
+_exclusions = {
+    # Bamboo says: don't build release for hikey when in aarch64 arm_hyp mode
+    'HIKEY': [lambda b: b.is_hyp() and b.get_mode() == 64 and b.is_release()],
+    # MCS exclusions:
+    # No MCS + SMP for platforms with global timer for now (see seL4/seL4#513)
+    'SABRE': [lambda b: b.is_smp() and b.is_mcs()],
+    'TX1': [_sched_context_fail],
+    'TX2': [_sched_context_fail],
+    'ODROID_C4': [_sched_context_fail],
+    # CACHEFLUSH0001 fails on ODROID_XU4: https://github.com/seL4/sel4test/issues/80
+    'ODROID_XU4': [lambda b: b.is_debug() and b.is_mcs() and b.is_hyp() and
+                   b.is_clang() and b.get_mode() == 32],
+    # IMX8MM_EVK is failing multicore tests for MCS + SMP:
+    'IMX8MM_EVK': [lambda b: b.is_mcs() and b.is_smp()],
+    # HYP/SMP exclusions:
+    # IMX8MQ_EVK is failing multicore tests for SMP + HYP + clang
+    # see also https://github.com/seL4/sel4test/issues/44
+    'IMX8MQ_EVK': [lambda b: b.is_hyp() and b.is_smp() and b.is_clang()],
+    # see also https://github.com/seL4/seL4/issues/1160
+    'HIFIVE': [lambda b: b.is_clang() and b.is_smp() and b.is_release()],
+}
+
+
 def build_filter(build: Build) -> bool:
-    plat = build.get_platform()
+    # cheap universal checks first, so most rejected builds never reach the
+    # per-platform exclusions below
 
-    if plat.no_hw_build:
+    # run NUM_DOMAINS > 1 tests only on release builds
+    if build.is_domains() and not build.is_release():
         return False
 
-    if plat.arch == 'arm':
-        # Bamboo says: don't build release for hikey when in aarch64 arm_hyp mode
-        if build.is_hyp() and build.get_mode() == 64 and build.is_release() and \
-           plat.name == 'HIKEY':
-            return False
-
-        # MCS exclusions:
-        # No MCS + SMP for platforms with global timer for now (see seL4/seL4#513)
-        if plat.name == 'SABRE' and build.is_smp() and build.is_mcs():
-            return False
-        # SCHED_CONTEXT_0014 fails on TX1, TX2 and ODROID_C4: https://github.com/seL4/seL4/issues/928
-        if plat.name in ['TX1', 'TX2', 'ODROID_C4'] and \
-           build.is_mcs() and build.is_smp() and build.is_hyp() and build.is_clang():
-            return False
-        # CACHEFLUSH0001 fails on ODROID_XU4: https://github.com/seL4/sel4test/issues/80
-        if plat.name == 'ODROID_XU4' and build.is_debug() and build.is_mcs() and \
-           build.is_hyp() and build.is_clang() and build.get_mode() == 32:
-            return False
-        # IMX8MM_EVK is failing multicore tests for MCS + SMP:
-        if plat.name == 'IMX8MM_EVK' and build.is_mcs() and build.is_smp():
-            return False
+    plat = build.get_platform()
 
-        # HYP/SMP exclusions:
-        # IMX8MQ_EVK is failing multicore tests for SMP + HYP + clang
-        # see also https://github.com/seL4/sel4test/issues/44
-        if plat.name == 'IMX8MQ_EVK' and build.is_hyp() and build.is_smp() and build.is_clang():
-            return False
+    if plat.no_hw_build:
+        return False
 
-    if plat.arch == 'x86':
-        # Bamboo config says no VTX for SMP or verification
-        if build.is_hyp() and (build.is_smp() or build.is_verification()):
-            return False
+    # Bamboo config says no VTX for SMP or verification
+    if plat.arch == 'x86' and build.is_hyp() and (build.is_smp() or build.is_verification()):
+        return False
 
-    if plat.arch == 'riscv':
-        # see also https://github.com/seL4/seL4/issues/1160
-        if plat.name == 'HIFIVE' and build.is_clang() and build.is_smp() and build.is_release():
+    for excluded in _exclusions.get(plat.name, ()):
+        if excluded(build):
             return False
 
-    # run NUM_DOMAINS > 1 tests only on release builds
-    if build.is_domains() and not build.is_release():
-        return False
-
     return True
 
 
@@ -130,28 +136,36 @@ def to_json(builds: List[Build]) -> str:
                 {"platform": plat.name, "march": plat.march, "compiler": "clang", "mode": 64},
             ]
 
-    platforms = set([b.get_platform() for b in builds])
-    matrix = {"include": [run for plat in platforms for run in run_for_plat(plat)]}
+    # dedup by platform name; a dict instead of a set keeps the matrix order
+    # deterministic (insertion order) across runs
+    platforms = {}
+    for b in builds:
+        plat = b.get_platform()
+        platforms.setdefault(plat.name, plat)
+    matrix = {"include": [run for plat in platforms.values() for run in run_for_plat(plat)]}
 
-    return "matrix=" + json.dumps(matrix)
+    # compact separators; the output is consumed by GitHub, not humans
+    return "matrix=" + json.dumps(matrix, separators=(',', ':'))
 
 
 # If called as main, run all builds from builds.yml
 if __name__ == '__main__':
     builds = load_builds(os.path.dirname(__file__) + "/builds.yml", filter_fun=build_filter)
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--dump':
+    arg = sys.argv[1] if len(sys.argv) > 1 else None
+
+    if arg == '--dump':
         pprint(builds)
         sys.exit(0)
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--matrix':
+    if arg == '--matrix':
         gh_output(to_json(builds))
         sys.exit(0)
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--hw':
+    if arg == '--hw':
         sys.exit(run_builds(builds, hw_run))
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--post':
+    if arg == '--post':
         release_mq_locks(builds)
         sys.exit(0)
 
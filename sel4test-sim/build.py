@@ -23,8 +23,12 @@ def run_simulation(manifest_dir: str, build: Build):
     script = [
         ["../init-build.sh"] + build.settings_args(),
         ["ninja"],
+        # stdbuf keeps expect's output line-buffered on the pipe, so test
+        # results reach the log (and tee) as they happen instead of in 4 KiB
+        # stdio chunks
         ["bash", "-c",
-         f"expect -c 'spawn ./simulate; set timeout 1200; expect {expect}' | tee {junit_results}"]
+         f"stdbuf -oL expect -c 'spawn ./simulate; set timeout 1200; expect {expect}'"
+         f" | tee {junit_results}"]
     ]
 
     return run_build_script(manifest_dir, build, script, junit=True)
@@ -34,7 +38,9 @@ def run_simulation(manifest_dir: str, build: Build):
 if __name__ == '__main__':
     builds = load_builds(os.path.dirname(__file__) + "/builds.yml")
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--dump':
+    arg = sys.argv[1] if len(sys.argv) > 1 else None
+
+    if arg == '--dump':
         pprint(builds)
         sys.exit(0)
 
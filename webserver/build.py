@@ -9,11 +9,13 @@ Expects seL4-platforms/ to be co-located or otherwise in the PYTHONPATH.
 """
 
 from builds import Build, run_build_script, run_builds, load_builds, release_mq_locks, SKIP, sim_script
-from pprint import pprint
 
 import os
 import sys
 
+# builds.yml is co-located with this script
+builds_yml = os.path.join(os.path.dirname(__file__), "builds.yml")
+
 
 # See also builds.yml for how builds are split up in this test. We use the build
 # matrix and filtering for the hardware builds, and an explicit list for the
@@ -26,13 +28,13 @@ def run_build(manifest_dir: str, build: Build):
 
     plat = build.get_platform()
 
-    build.files = plat.image_names(build.get_mode(), "capdl-loader")
-    del build.settings['BAMBOO']    # not used in this test, avoid warning
+    build.settings.pop('BAMBOO', None)  # not used in this test, avoid warning
 
     script = [
         ["../init-build.sh"] + build.settings_args(),
         ["ninja"],
-        ["tar", "czf", f"../{build.name}-images.tar.gz", "images/"],
+        # pigz compresses on all cores, plain gzip is single-threaded
+        ["tar", "-I", "pigz", "-cf", f"../{build.name}-images.tar.gz", "images/"],
     ]
 
     if plat.has_simulation and plat.name != 'PC99':
@@ -48,9 +50,6 @@ def hw_run(manifest_dir: str, build: Build):
         print(f"Build {build.name} disabled, skipping.")
         return SKIP
 
-    plat = build.get_platform()
-    build.files = plat.image_names(build.get_mode(), "capdl-loader")
-
     script, final = build.hw_run('log.txt')
 
     return run_build_script(manifest_dir, build, script, final_script=final)
@@ -58,14 +57,17 @@ def hw_run(manifest_dir: str, build: Build):
 
 # If called as main, run all builds from builds.yml
 if __name__ == '__main__':
-    builds = load_builds(os.path.dirname(__file__) + "/builds.yml")
+    builds = load_builds(builds_yml)
+
+    arg = sys.argv[1] if len(sys.argv) > 1 else None
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--dump':
+    if arg == '--dump':
+        from pprint import pprint
         pprint(builds)
         sys.exit(0)
-    elif len(sys.argv) > 1 and sys.argv[1] == '--hw':
+    elif arg == '--hw':
         sys.exit(run_builds(builds, hw_run))
-    elif len(sys.argv) > 1 and sys.argv[1] == '--post':
+    elif arg == '--post':
         release_mq_locks(builds)
         sys.exit(0)
 